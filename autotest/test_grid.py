@@ -174,6 +174,223 @@ def test_get_cell_vertices():
         mg.get_cell_vertices(nn=0)
 
 
+def test_vertex_get_cell_vertices():
+    mg = GridCases.vertex_small()
+    assert mg.get_cell_vertices(0) == [
+        (0.0, 3.0),
+        (1.0, 3.0),
+        (1.0, 2.0),
+        (0.0, 2.0),
+    ]
+    # node numbers in lower layers map to the same cell2d
+    assert mg.get_cell_vertices(mg.ncpl + 4) == mg.get_cell_vertices(4)
+    for cellid in (-1, mg.nnodes):
+        with pytest.raises(IndexError):
+            mg.get_cell_vertices(cellid)
+    assert mg.extent == (0.0, 2.0, 0.0, 3.0)
+    assert mg.extent is mg.extent
+    assert np.allclose(mg.verts[4], (1.0, 2.0))
+    assert np.allclose(mg.xvertices[3], [1.0, 2.0, 2.0, 1.0])
+    assert np.allclose(mg.yvertices[3], [2.0, 2.0, 1.0, 1.0])
+
+    mg.set_coord_info(xoff=100.0, yoff=200.0, angrot=90.0)
+    assert np.allclose(
+        mg.get_cell_vertices(0),
+        [(97.0, 200.0), (97.0, 201.0), (98.0, 201.0), (98.0, 200.0)],
+    )
+    assert np.allclose(mg.extent, (97.0, 100.0, 200.0, 202.0))
+    assert np.allclose(mg.verts[4], (98.0, 201.0))
+    assert np.allclose(mg.xvertices[3], [98.0, 98.0, 99.0, 99.0])
+    assert np.allclose(mg.yvertices[3], [201.0, 202.0, 202.0, 201.0])
+
+
+def test_vertex_map_polygons():
+    mg = GridCases.vertex_small()
+    polys = mg.map_polygons
+    assert len(polys) == mg.ncpl
+    assert mg.map_polygons is polys
+    # paths are created on first access and cached
+    assert mg.get_map_polygon(2) is polys[2]
+    assert polys[-1] is polys[mg.ncpl - 1]
+    assert polys[1:3] == [polys[1], polys[2]]
+    with pytest.raises(IndexError):
+        polys[mg.ncpl]
+    for nn, path in enumerate(polys):
+        assert np.allclose(path.vertices, mg.get_cell_vertices(nn))
+    assert len(list(polys)) == mg.ncpl
+
+    # polygons are rebuilt when the coordinate info changes
+    mg.set_coord_info(xoff=10.0, yoff=10.0)
+    assert mg.map_polygons is not polys
+    assert np.allclose(
+        mg.map_polygons[0].vertices, np.array(polys[0].vertices) + 10.0
+    )
+
+
+@requires_pkg("shapely")
+def test_vertex_map_polygons_simplify(monkeypatch):
+    import flopy.discretization.vertexgrid as vertexgrid
+
+    # square cell with extra vertices along its sides
+    vertices = [
+        [0, 0.0, 0.0],
+        [1, 0.5, 0.001],
+        [2, 1.0, 0.0],
+        [3, 1.0, 0.5],
+        [4, 1.0, 1.0],
+        [5, 0.5, 1.0],
+        [6, 0.0, 1.0],
+        [7, 0.0, 0.5],
+    ]
+    cell2d = [[0, 0.5, 0.5, 8, 0, 1, 2, 3, 4, 5, 6, 7]]
+    mg = VertexGrid(vertices=vertices, cell2d=cell2d)
+
+    polys = mg.map_polygons
+    assert len(polys[0].vertices) == 8
+    simplified = mg.get_map_polygons(tolerance=0.01)
+    assert len(simplified) == 1
+    assert np.allclose(
+        simplified[0].vertices,
+        [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)],
+    )
+    assert simplified[0].contains_point((0.5, 0.5))
+    assert mg.get_map_polygons(tolerance=0.01) is simplified
+    assert np.allclose(mg.map_polygons[0].vertices, polys[0].vertices)
+
+    # module-level default
+    monkeypatch.setattr(vertexgrid, "MAP_POLYGON_TOLERANCE", 0.01)
+    assert len(mg.map_polygons[0].vertices) == 4
+    assert len(mg.get_cell_vertices(0)) == 8
+
+    # polygons without redundant vertices keep the same vertices
+    mg = GridCases.vertex_small()
+    simplified = mg.get_map_polygons(tolerance=1e-6)
+    for nn in range(mg.ncpl):
+        assert np.allclose(simplified[nn].vertices, mg.get_cell_vertices(nn))
+
+
+def test_vertex_iverts():
+    mg = GridCases.vertex_small()
+    iverts = [list(c[4:]) for c in mg.cell2d]
+    assert mg.iverts == iverts
+
+    # cell2d records padded with None
+    cell2d = [tuple(c) + (None,) for c in mg.cell2d]
+    mg = VertexGrid(vertices=mg._vertices, cell2d=cell2d)
+    assert mg.iverts == iverts
+    assert mg.cell2d == [list(c[:-1]) for c in cell2d]
+
+    # cell2d numpy recarray
+    rec = np.rec.fromrecords([c[:-1] for c in cell2d])
+    mg = VertexGrid(vertices=mg._vertices, cell2d=rec)
+    assert mg.iverts == iverts
+
+    vertices = [[0, 0.0, 0.0, 0.0], [1, 1.0, 0.0, 0.0], [2, 2.0, 0.0, 0.0]]
+    cell1d = [[0, 0.5, 0.0, 0, 1], [1, 1.5, 0.0, 1, 2]]
+    mg = VertexGrid(vertices=vertices, cell1d=cell1d)
+    assert mg.cell1d == cell1d
+    assert mg.cell2d is None
+    assert mg.iverts == [[0, 1], [1, 2]]
+
+
+def test_vertex_unordered_vertex_numbers():
+    mg = GridCases.vertex_small()
+    # renumber the vertices and store them in reverse order
+    vertices = [[v[0] + 10] + list(v[1:]) for v in mg._vertices][::-1]
+    cell2d = [list(c[:4]) + [iv + 10 for iv in c[4:]] for c in mg.cell2d]
+    mg2 = VertexGrid(
+        vertices=vertices, cell2d=cell2d, top=mg.top, botm=mg.botm
+    )
+    for nn in range(mg.ncpl):
+        assert mg2.get_cell_vertices(nn) == mg.get_cell_vertices(nn)
+    assert np.array_equal(mg2.verts, mg.verts[::-1])
+    assert mg2.intersect(1.5, 1.5) == mg.intersect(1.5, 1.5)
+
+    cell2d[0][4] = 1
+    mg2 = VertexGrid(
+        vertices=vertices, cell2d=cell2d, top=mg.top, botm=mg.botm
+    )
+    with pytest.raises(KeyError):
+        mg2.xcellcenters
+
+
+def test_vertex_vertices_for_layer():
+    mg = GridCases.vertex_small()
+    xgrid = mg.get_xvertices_for_layer(0)
+    ygrid = mg.get_yvertices_for_layer(0)
+    assert xgrid.dtype == np.float64 and ygrid.dtype == np.float64
+    assert xgrid.shape == ygrid.shape == (mg.ncpl, 4)
+    assert np.array_equal(xgrid, mg.xvertices)
+    assert np.array_equal(ygrid, mg.yvertices)
+    for xv in mg.xvertices:
+        assert xv.flags.c_contiguous and xv.dtype == np.float64
+
+    # cells with a different number of vertices are padded with nan
+    mg = GridCases.vertex_mixed()
+    xgrid = mg.get_xvertices_for_layer(0)
+    ygrid = mg.get_yvertices_for_layer(0)
+    assert xgrid.dtype == np.float64
+    assert np.array_equal(
+        xgrid, [[0.0, 1.0, 1.0, 0.0], [1.0, 2.0, 1.0, np.nan]], equal_nan=True
+    )
+    assert np.array_equal(
+        ygrid, [[1.0, 1.0, 0.0, 0.0], [1.0, 1.0, 0.0, np.nan]], equal_nan=True
+    )
+
+
+def test_vertex_grid_lines():
+    mg = GridCases.vertex_small()
+    lines = mg.grid_lines
+    assert lines.shape == (20, 2, 2)
+    assert np.allclose(lines[0], [(0.0, 2.0), (0.0, 3.0)])
+    assert np.allclose(lines[1], [(0.0, 3.0), (1.0, 3.0)])
+    assert np.allclose(lines[5], [(1.0, 3.0), (2.0, 3.0)])
+    for nn in range(mg.ncpl):
+        verts = mg.get_cell_vertices(nn)
+        for iv, vert in enumerate(verts):
+            assert np.allclose(lines[4 * nn + iv], [verts[iv - 1], vert])
+
+
+def test_vertex_cache_readonly():
+    mg = GridCases.vertex_small()
+    xc, yc, zc = mg.xyzcellcenters
+    xv, yv, zv = mg.xyzvertices
+    for arr in (xc, yc, zc, xv[0], yv[0], zv, mg.verts):
+        assert not arr.flags.writeable
+        with pytest.raises(ValueError):
+            arr[0] = 0.0
+
+    # arrays are shared, the containers are not
+    assert mg.xyzcellcenters[0] is xc
+    assert mg.xyzcellcenters is not mg.xyzcellcenters
+    xc = xc.copy()
+    xc[0] = -1.0
+    assert mg.xcellcenters[0] == 0.5
+
+
+def test_vertex_plottable_layers():
+    mg = GridCases.vertex_small()
+    nlay, ncpl = mg.nlay, mg.ncpl
+    a = np.arange(mg.nnodes, dtype=float)
+    a3d = a.reshape(nlay, 1, ncpl)
+    assert mg.get_number_plottable_layers(a[:ncpl]) == 1
+    assert mg.get_number_plottable_layers(a) == nlay
+    assert mg.get_number_plottable_layers(a3d) == nlay
+    with pytest.raises(ValueError):
+        mg.get_number_plottable_layers(a[:-1])
+
+    for layer in range(nlay):
+        expected = a[layer * ncpl : (layer + 1) * ncpl]
+        for arr in (a, a.reshape(nlay, ncpl), a3d, a3d.reshape(1, nlay, -1)):
+            plotarray = mg.get_plottable_layer_array(arr, layer)
+            assert np.array_equal(plotarray, expected)
+    assert np.array_equal(mg.get_plottable_layer_array(a[:ncpl], 1), a[:ncpl])
+    with pytest.raises(ValueError):
+        mg.get_plottable_layer_array(a.reshape(nlay, ncpl, 1), 0)
+    with pytest.raises(ValueError):
+        mg.get_plottable_layer_array(a[:-1], 0)
+
+
 def test_get_lrc_get_node():
     nlay, nrow, ncol = 3, 4, 5
     nnodes = nlay * nrow * ncol
@@ -373,6 +590,49 @@ def test_vertex_xyz_intersect(example_data_path):
             raise AssertionError("Vertex grid intersection failed")
 
 
+@pytest.mark.parametrize("cell_tree", [True, False])
+def test_vertex_intersect_small(monkeypatch, cell_tree):
+    if not cell_tree:
+        # use the bounding box and point in polygon fallback
+        monkeypatch.setattr(
+            VertexGrid, "_cell_tree", property(lambda self: None)
+        )
+    mg = GridCases.vertex_small()
+    xc, yc, zc = mg.xyzcellcenters
+    for icell in range(mg.ncpl):
+        assert mg.intersect(xc[icell], yc[icell]) == icell
+        for lay in range(mg.nlay):
+            z = zc[lay, icell]
+            assert mg.intersect(xc[icell], yc[icell], z) == (lay, icell)
+
+    # points on a shared edge or vertex return the lowest cell number
+    assert mg.intersect(1.0, 2.5) == 0
+    assert mg.intersect(1.0, 2.0) == 0
+    assert mg.intersect(1.5, 1.0) == 3
+
+    # layer interfaces return the upper layer
+    assert mg.intersect(0.5, 0.5, 10.0) == (0, 4)
+    assert mg.intersect(0.5, 0.5, 5.0) == (0, 4)
+    assert mg.intersect(0.5, 0.5, 0.0) == (1, 4)
+
+    assert np.isnan(mg.intersect(1.5, 0.5, forgive=True))
+    assert all(np.isnan(mg.intersect(0.5, 0.5, 20.0, forgive=True)))
+    with pytest.raises(Exception, match="outside of the model area"):
+        mg.intersect(1.5, 0.5)
+
+    lay, icell2d = mg.intersect(0.5, 0.5, 0.0)
+    assert type(lay) is int and type(icell2d) is int
+
+    # cells with a different number of vertices
+    mg = GridCases.vertex_mixed()
+    assert mg.intersect(0.5, 0.5) == 0
+    assert mg.intersect(1.3, 0.7) == 1
+    assert mg.intersect(1.0, 0.5) == 0
+    assert mg.intersect(1.5, 0.5) == 1
+    assert mg.intersect(1.3, 0.7, 0.5) == (0, 1)
+    assert np.isnan(mg.intersect(1.9, 0.1, forgive=True))
+
+
 def test_unstructured_xyz_intersect(example_data_path):
     ws = example_data_path / "unstructured"
     name = ws / "ugrid_verts.dat"
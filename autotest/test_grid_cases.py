@@ -105,6 +105,21 @@ class GridCases:
             idomain=idomain,
         )
 
+    @staticmethod
+    def vertex_mixed():
+        # a quadrilateral and a triangle cell
+        vertices = [
+            [0, 0.0, 1.0],
+            [1, 1.0, 1.0],
+            [2, 2.0, 1.0],
+            [3, 0.0, 0.0],
+            [4, 1.0, 0.0],
+        ]
+        cell2d = [[0, 0.5, 0.5, 4, 0, 1, 4, 3], [1, 1.3, 0.7, 3, 1, 2, 4]]
+        top = np.ones(2, dtype=float)
+        botm = np.zeros((1, 2), dtype=float)
+        return VertexGrid(vertices=vertices, cell2d=cell2d, top=top, botm=botm)
+
     @staticmethod
     def unstructured_small():
         nlay = 3
@@ -1,7 +1,13 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import numpy as np
 import pytest
 
 from autotest.test_grid_cases import GridCases
+from flopy.utils import _numba_kernels
+from flopy.utils._numba_kernels import _point_in_poly_numpy, point_in_poly
 from flopy.utils.geometry import is_clockwise, point_in_polygon
 
 
@@ -87,3 +93,55 @@ def test_point_in_polygon_faces():
     mask = point_in_polygon(xpts, ypts, cell)
     assert mask.sum() == 2  # only inner faces
     debug_plot(grid, cell, xpts, ypts, mask)
+
+
+@pytest.mark.parametrize("func", [point_in_poly, _point_in_poly_numpy])
+@pytest.mark.parametrize("clockwise", [True, False])
+def test_point_in_poly(func, clockwise):
+    xs = np.array([0.0, 2.0, 2.0, 1.0, 0.0])
+    ys = np.array([0.0, 0.0, 2.0, 3.0, 2.0])
+    if clockwise:
+        xs, ys = xs[::-1].copy(), ys[::-1].copy()
+
+    # interior
+    assert func(1.0, 1.0, xs, ys, 1e-9)
+    assert func(1.0, 2.9, xs, ys, 1e-9)
+    # vertices and faces are inside
+    for px, py in zip(xs, ys):
+        assert func(px, py, xs, ys, 1e-9)
+    assert func(1.0, 0.0, xs, ys, 1e-9)
+    assert func(0.5, 2.5, xs, ys, 1e-9)
+    assert func(2.0 + 1e-10, 1.0, xs, ys, 1e-9)
+    # exterior
+    assert not func(2.0 + 1e-6, 1.0, xs, ys, 1e-9)
+    assert not func(0.1, 2.9, xs, ys, 1e-9)
+    assert not func(-1.0, 1.0, xs, ys, 1e-9)
+    assert not func(1.0, -1e-6, xs, ys, 1e-9)
+
+
+@pytest.mark.parametrize("min_size", [0, _numba_kernels.GATHER_MIN_SIZE])
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_gather_vertices(monkeypatch, min_size, ndim):
+    monkeypatch.setattr(_numba_kernels, "GATHER_MIN_SIZE", min_size)
+    rng = np.random.default_rng(0)
+    coords = rng.random((50, ndim))
+    counts = rng.integers(3, 8, size=20)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    flat_ids = rng.integers(0, len(coords), size=offsets[-1])
+    out = _numba_kernels.gather_vertices(coords, flat_ids, offsets)
+    assert out.shape == (offsets[-1], ndim)
+    assert np.array_equal(out, coords[flat_ids])
+
+
+def test_gather_vertices_small_grid_skips_numba():
+    # small grids are gathered with numpy, numba should not be imported
+    script = (
+        "import sys\n"
+        "from autotest.test_grid_cases import GridCases\n"
+        "grid = GridCases.vertex_small()\n"
+        "grid.xyzvertices\n"
+        "assert 'numba' not in sys.modules\n"
+    )
+    root = Path(__file__).parent.parent
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
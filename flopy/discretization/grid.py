@@ -18,10 +18,32 @@ from ..utils.crs import get_crs
 from ..utils.gridutil import get_lni
 
 
+def _is_readonly(data):
+    """
+    Check if data is None, a read-only ndarray, or a (nested) list or
+    tuple of these.
+    """
+    if data is None:
+        return True
+    if isinstance(data, np.ndarray):
+        return not data.flags.writeable
+    if isinstance(data, (list, tuple)):
+        return all(_is_readonly(item) for item in data)
+    return False
+
+
+def _copy_containers(data):
+    """
+    Copy the (nested) lists and tuples of data, sharing the arrays.
+    """
+    if isinstance(data, (list, tuple)):
+        return type(data)(_copy_containers(item) for item in data)
+    return data
+
+
 class CachedData:
     def __init__(self, data):
-        self._data = data
-        self.out_of_date = False
+        self.update_data(data)
 
     @property
     def data_nocopy(self):
@@ -29,10 +51,15 @@ class CachedData:
 
     @property
     def data(self):
+        # read-only arrays cannot be modified by the caller, so only the
+        # containers holding them are copied
+        if self._readonly:
+            return _copy_containers(self._data)
         return copy.deepcopy(self._data)
 
     def update_data(self, data):
         self._data = data
+        self._readonly = _is_readonly(data)
         self.out_of_date = False
 
 
@@ -1,12 +1,64 @@
-import copy
 import os
+from collections.abc import Sequence
+from functools import cached_property
+from itertools import islice
 
 import numpy as np
 from matplotlib.path import Path
 
-from ..utils.geometry import is_clockwise, transform
+from ..utils import import_optional_dependency
+from ..utils.geometry import transform
+from ..utils.parse_version import Version
 from .grid import CachedData, Grid
 
+# default tolerance used to simplify the cell polygons returned by
+# VertexGrid.map_polygons, None disables simplification
+MAP_POLYGON_TOLERANCE = None
+
+
+class _LazyPathList(Sequence):
+    """
+    Read-only sequence of matplotlib Path objects for the cells of a
+    vertex grid. A Path is created the first time its cell is accessed
+    and is cached after that.
+
+    Parameters
+    ----------
+    offsets : ndarray
+        array of size ncpl + 1, the vertices of cell i are stored in
+        vert_xy[offsets[i]:offsets[i + 1]]
+    vert_xy : ndarray
+        x and y coordinates of the cell vertices, stored cell by cell
+    """
+
+    def __init__(self, offsets, vert_xy):
+        self._offsets = offsets
+        self._vert_xy = vert_xy
+        self._paths = {}
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"cell {index} out of range for {len(self)}")
+        path = self._paths.get(index)
+        if path is None:
+            path = Path(
+                self._vert_xy[self._offsets[index] : self._offsets[index + 1]]
+            )
+            self._paths[index] = path
+        return path
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
 
 class VertexGrid(Grid):
     """
@@ -107,6 +159,13 @@ class VertexGrid(Grid):
         else:
             self._nlay = None
             self._ncpl = None
+        # incremented each time the grid geometry info is rebuilt
+        self._geom_rev = 0
+        self._polygons_rev = None
+        self._polygons_tol = None
+        self._vert_ids_sorted = None
+        self._vert_order = None
+        self._vert_coords = None
 
     @property
     def is_valid(self):
@@ -126,7 +185,7 @@ class VertexGrid(Grid):
             return True
         return False
 
-    @property
+    @cached_property
     def nlay(self):
         if self._cell1d is not None:
             return 1
@@ -135,7 +194,7 @@ class VertexGrid(Grid):
         else:
             return self._nlay
 
-    @property
+    @cached_property
     def ncpl(self):
         if self._cell1d is not None:
             return len(self._cell1d)
@@ -146,26 +205,34 @@ class VertexGrid(Grid):
         else:
             return self._ncpl
 
-    @property
+    @cached_property
     def nnodes(self):
         return self.nlay * self.ncpl
 
-    @property
+    @cached_property
     def nvert(self):
         return len(self._vertices)
 
     @property
     def iverts(self):
         if self._cell2d is not None:
-            return [list(t)[4:] for t in self.cell2d]
+            cells, ivert = self._cell2d, 4
         elif self._cell1d is not None:
-            return [list(t)[3:] for t in self.cell1d]
+            cells, ivert = self._cell1d, 3
+        else:
+            return None
+        # skip the leading cell attributes and drop padding in a single
+        # pass, islice also works for numpy records that cannot be sliced
+        return [
+            [iv for iv in islice(t, ivert, None) if iv is not None]
+            for t in cells
+        ]
 
     @property
     def cell1d(self):
         if self._cell1d is not None:
             return [
-                [ivt for ivt in t if ivt is not None] for t in self._cell2d
+                [ivt for ivt in t if ivt is not None] for t in self._cell1d
             ]
 
     @property
@@ -177,13 +244,30 @@ class VertexGrid(Grid):
 
     @property
     def verts(self):
-        verts = np.array([list(t)[1:] for t in self._vertices], dtype=float).T
-        x, y = transform(
-            verts[0], verts[1], self.xoffset, self.yoffset, self.angrot_radians
-        )
-        return np.array(list(zip(x, y)))
+        cache_index = "verts"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            self._ensure_vert_arrays()
+            verts = np.ascontiguousarray(self._vert_coords[:, :2])
+            if self._has_ref_coordinates:
+                x, y = transform(
+                    verts[:, 0],
+                    verts[:, 1],
+                    self.xoffset,
+                    self.yoffset,
+                    self.angrot_radians,
+                )
+                verts = np.column_stack((x, y))
+            verts.setflags(write=False)
+            self._cache_dict[cache_index] = CachedData(verts)
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
 
-    @property
+    @cached_property
     def shape(self):
         return self.nlay, self.ncpl
 
@@ -194,16 +278,18 @@ class VertexGrid(Grid):
 
     @property
     def extent(self):
-        self._copy_cache = False
-        xvertices = np.hstack(self.xvertices)
-        yvertices = np.hstack(self.yvertices)
-        self._copy_cache = True
-        return (
-            np.min(xvertices),
-            np.max(xvertices),
-            np.min(yvertices),
-            np.max(yvertices),
-        )
+        cache_index = "extent"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            vert_xy = self._vert_xy
+            xmin, ymin = vert_xy.min(axis=0)
+            xmax, ymax = vert_xy.max(axis=0)
+            self._cache_dict[cache_index] = CachedData(
+                (xmin, xmax, ymin, ymax)
+            )
+        return self._cache_dict[cache_index].data_nocopy
 
     @property
     def grid_lines(self):
@@ -212,23 +298,24 @@ class VertexGrid(Grid):
         a model grid line collection
 
         Returns:
-            list: grid line vertices
-        """
-        self._copy_cache = False
-        xgrid = self.xvertices
-        ygrid = self.yvertices
-
-        lines = []
-        for ncell, verts in enumerate(xgrid):
-            for ix, vert in enumerate(verts):
-                lines.append(
-                    [
-                        (xgrid[ncell][ix - 1], ygrid[ncell][ix - 1]),
-                        (xgrid[ncell][ix], ygrid[ncell][ix]),
-                    ]
-                )
-        self._copy_cache = True
-        return lines
+            ndarray: grid line vertices, shape (nlines, 2, 2)
+        """
+        cache_index = "gridlines"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            # each cell vertex is paired with the previous vertex of the
+            # cell, and the first vertex with the last one
+            offsets = self._vert_offsets
+            vert_xy = self._vert_xy
+            prev_xy = np.empty_like(vert_xy)
+            prev_xy[1:] = vert_xy[:-1]
+            prev_xy[offsets[:-1]] = vert_xy[offsets[1:] - 1]
+            lines = np.stack((prev_xy, vert_xy), axis=1)
+            lines.setflags(write=False)
+            self._cache_dict[cache_index] = CachedData(lines)
+        return self._cache_dict[cache_index].data_nocopy
 
     @property
     def xyzcellcenters(self):
@@ -259,7 +346,19 @@ class VertexGrid(Grid):
             cache_index not in self._cache_dict
             or self._cache_dict[cache_index].out_of_date
         ):
-            self._build_grid_geometry_info()
+            # split the flat vertex arrays into per cell arrays
+            offsets, _, zvertices = self._get_geometry_cache("vertcsr")
+            xvertices = np.split(self._xvert_flat, offsets[1:-1])
+            yvertices = np.split(self._yvert_flat, offsets[1:-1])
+            if zvertices is not None:
+                zvertices = np.split(zvertices, offsets[1:-1])
+            else:
+                zvertices, _ = self._zcoords()
+                if zvertices is not None:
+                    zvertices.setflags(write=False)
+            self._cache_dict[cache_index] = CachedData(
+                [xvertices, yvertices, zvertices]
+            )
         if self._copy_cache:
             return self._cache_dict[cache_index].data
         else:
@@ -268,25 +367,122 @@ class VertexGrid(Grid):
     @property
     def map_polygons(self):
         """
-        Get a list of matplotlib Polygon patches for plotting
+        Get a sequence of matplotlib Path objects for plotting. The Paths
+        are created when they are first accessed, and the sequence is
+        cached and shared between calls. Cell polygons are simplified
+        when the module-level MAP_POLYGON_TOLERANCE is set, see
+        get_map_polygons().
 
         Returns
         -------
-            list of Polygon objects
+            sequence of Path objects
         """
-        cache_index = "xyzgrid"
+        return self.get_map_polygons()
+
+    def get_map_polygon(self, cellid):
+        """
+        Get the matplotlib Path object of a single cell, without
+        creating the Paths of the other cells.
+
+        Parameters
+        ----------
+        cellid : int
+            cell2d number
+
+        Returns
+        -------
+            Path
+        """
+        return self.map_polygons[cellid]
+
+    def get_map_polygons(self, tolerance=None):
+        """
+        Get a sequence of matplotlib Path objects for plotting, optionally
+        with simplified cell polygons to speed up drawing grids with many
+        vertices per cell. The Paths are created when they are first
+        accessed, and the sequence is cached and shared between calls.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            tolerance in model units used to simplify the cell polygons
+            with shapely. Defaults to the module-level
+            MAP_POLYGON_TOLERANCE, which is None (no simplification).
+            Simplification requires shapely>=2.0.
+
+        Returns
+        -------
+            sequence of Path objects
+        """
+        if tolerance is None:
+            tolerance = MAP_POLYGON_TOLERANCE
+        # rebuilds the geometry info first when it is out of date
+        offsets = self._vert_offsets
+        vert_xy = self._vert_xy
         if (
-            cache_index not in self._cache_dict
-            or self._cache_dict[cache_index].out_of_date
+            self._polygons is None
+            or self._polygons_rev != self._geom_rev
+            or self._polygons_tol != tolerance
         ):
-            self.xyzvertices
-            self._polygons = None
-        if self._polygons is None:
-            self._polygons = [
-                Path(self.get_cell_vertices(nn)) for nn in range(self.ncpl)
-            ]
+            if tolerance:
+                offsets, vert_xy = self._simplify_polygons(tolerance)
+            self._polygons = _LazyPathList(offsets, vert_xy)
+            self._polygons_rev = self._geom_rev
+            self._polygons_tol = tolerance
+
+        return self._polygons
 
-        return copy.copy(self._polygons)
+    def _cell_polygons(self, shapely):
+        """
+        Build the cell polygons from the flat vertex arrays
+
+        Parameters
+        ----------
+        shapely : module
+            the shapely>=2.0 module
+
+        Returns
+        -------
+            np.ndarray of shapely Polygons, one per cell
+        """
+        icell = np.repeat(np.arange(self.ncpl), np.diff(self._vert_offsets))
+        return shapely.polygons(
+            shapely.linearrings(self._vert_xy, indices=icell)
+        )
+
+    def _simplify_polygons(self, tolerance):
+        """
+        Simplify the cell polygons with shapely, without preserving
+        topology. Cells that collapse to an empty polygon keep their
+        original vertices.
+
+        Returns
+        -------
+            offsets and xy vertices of the simplified polygons, in the
+            same layout as _vert_offsets and _vert_xy
+        """
+        shapely = import_optional_dependency(
+            "shapely",
+            error_message="shapely is required to simplify map polygons.",
+            min_version="2.0",
+        )
+        polys = self._cell_polygons(shapely)
+        simplified = shapely.simplify(
+            polys, tolerance, preserve_topology=False
+        )
+        empty = shapely.is_empty(simplified)
+        simplified[empty] = polys[empty]
+        coords, index = shapely.get_coordinates(
+            shapely.get_exterior_ring(simplified), return_index=True
+        )
+        # drop the closing coordinate of each ring, so the vertices have
+        # the same layout as the unsimplified polygons
+        nverts = np.bincount(index, minlength=self.ncpl)
+        keep = np.ones(len(coords), dtype=bool)
+        keep[np.cumsum(nverts) - 1] = False
+        new_offsets = np.zeros(self.ncpl + 1, dtype=np.int64)
+        new_offsets[1:] = np.cumsum(nverts - 1)
+        return new_offsets, coords[keep]
 
     @property
     def geo_dataframe(self):
@@ -314,14 +510,19 @@ class VertexGrid(Grid):
             Grid object
         """
         if self.is_complete:
+            self._ensure_vert_arrays()
+            vert_xy = factor * self._vert_coords[:, :2]
+            cell_xy = factor * np.array(
+                [(c[1], c[2]) for c in self._cell2d], dtype=float
+            )
             return VertexGrid(
                 vertices=[
-                    [i[0], i[1] * factor, i[2] * factor]
-                    for i in self._vertices
+                    [v[0], x, y]
+                    for v, (x, y) in zip(self._vertices, vert_xy.tolist())
                 ],
                 cell2d=[
-                    [i[0], i[1] * factor, i[2] * factor] + i[3:]
-                    for i in self._cell2d
+                    [c[0], x, y] + list(c)[3:]
+                    for c, (x, y) in zip(self._cell2d, cell_xy.tolist())
                 ],
                 top=self.top * factor,
                 botm=self.botm * factor,
@@ -366,34 +567,27 @@ class VertexGrid(Grid):
         if local:
             # transform x and y to real-world coordinates
             x, y = super().get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    if z is None:
-                        return icell2d
-
-                    for lay in range(self.nlay):
-                        if (
-                            self.top_botm[lay, icell2d]
-                            >= z
-                            >= self.top_botm[lay + 1, icell2d]
-                        ):
-                            return lay, icell2d
+
+        cell_tree = self._cell_tree
+        if cell_tree is not None:
+            tree, point = cell_tree
+            # use a small distance, so that the edge of the cell is included
+            icells = np.sort(
+                tree.query(point(x, y), predicate="dwithin", distance=1e-9)
+            )
+        else:
+            icells = self._intersect_candidates(x, y)
+
+        for icell2d in icells:
+            icell2d = int(icell2d)
+            if z is None:
+                return icell2d
+
+            # binary search of the cell's (decreasing) layer elevations
+            col = self._top_botm_T[icell2d]
+            lay = max(np.searchsorted(-col, -z, side="left") - 1, 0)
+            if lay < self.nlay and col[lay] >= z >= col[lay + 1]:
+                return int(lay), icell2d
 
         if forgive:
             icell2d = np.nan
@@ -404,6 +598,81 @@ class VertexGrid(Grid):
 
         raise Exception("point given is outside of the model area")
 
+    @property
+    def _top_botm_T(self):
+        """
+        C-contiguous array of shape (ncpl, nlay + 1) with the top and
+        bottom elevations of each cell column
+        """
+        cache_index = "top_botm_t"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            self._cache_dict[cache_index] = CachedData(
+                np.ascontiguousarray(self.top_botm.T)
+            )
+        return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def _cell_tree(self):
+        """
+        Shapely STRtree of the cell polygons and the shapely Point class,
+        used to locate points in intersect(). None when shapely>=2.0 is not
+        available.
+        """
+        cache_index = "celltree"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            shapely = import_optional_dependency("shapely", errors="silent")
+            if shapely is None or Version(shapely.__version__) < Version(
+                "2.0"
+            ):
+                cell_tree = None
+            else:
+                polys = self._cell_polygons(shapely)
+                cell_tree = (shapely.STRtree(polys), shapely.Point)
+            self._cache_dict[cache_index] = CachedData(cell_tree)
+        return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def _cell_bbox(self):
+        """
+        Array of shape (ncpl, 4) with the (xmin, xmax, ymin, ymax) bounding
+        box of each cell
+        """
+        return self._get_geometry_cache("bbox")
+
+    def _intersect_candidates(self, x, y):
+        """
+        Generator of the CELL2D numbers that contain the point x, y, in
+        ascending order. Used by intersect() when shapely is not available.
+        """
+        # x and y at least have to be within the bounding box of the cell
+        bbox = self._cell_bbox
+        mask = (
+            (bbox[:, 0] <= x)
+            & (x <= bbox[:, 1])
+            & (bbox[:, 2] <= y)
+            & (y <= bbox[:, 3])
+        )
+        if not np.any(mask):
+            return
+
+        from ..utils._numba_kernels import point_in_poly
+
+        offsets = self._vert_offsets
+        xvert_flat = self._xvert_flat
+        yvert_flat = self._yvert_flat
+        for icell2d in np.flatnonzero(mask):
+            xa = xvert_flat[offsets[icell2d] : offsets[icell2d + 1]]
+            ya = yvert_flat[offsets[icell2d] : offsets[icell2d + 1]]
+            # edges of the cell are included, within a tolerance of 1e-9
+            if point_in_poly(float(x), float(y), xa, ya, 1e-9):
+                yield icell2d
+
     def get_cell_vertices(self, cellid):
         """
         Method to get a set of cell vertices for a single cell
@@ -412,17 +681,15 @@ class VertexGrid(Grid):
         Returns
         ------- list of x,y cell vertices
         """
-        while cellid >= self.ncpl:
-            if cellid > self.nnodes:
-                err = f"cellid {cellid} out of index for size {self.nnodes}"
-                raise IndexError(err)
+        nnodes = self.ncpl if self.nlay is None else self.nnodes
+        if cellid < 0 or cellid >= nnodes:
+            err = f"cellid {cellid} out of index for size {nnodes}"
+            raise IndexError(err)
+        _, cellid = divmod(cellid, self.ncpl)
 
-            cellid -= self.ncpl
-
-        self._copy_cache = False
-        cell_verts = list(zip(self.xvertices[cellid], self.yvertices[cellid]))
-        self._copy_cache = True
-        return cell_verts
+        offsets = self._vert_offsets
+        cell_verts = self._vert_xy[offsets[cellid] : offsets[cellid + 1]]
+        return list(map(tuple, cell_verts.tolist()))
 
     def plot(self, **kwargs):
         """
@@ -445,90 +712,230 @@ class VertexGrid(Grid):
 
     def _build_grid_geometry_info(self):
         cache_index_cc = "cellcenters"
-        cache_index_vert = "xyzgrid"
-
-        xcenters = []
-        ycenters = []
-        xvertices = []
-        yvertices = []
+        cache_index_csr = "vertcsr"
+        cache_index_bbox = "bbox"
+        cache_index_flat = "vertflat"
 
         if self._cell1d is not None:
-            zcenters = []
-            zvertices = []
-            vertexdict = {v[0]: [v[1], v[2], v[3]] for v in self._vertices}
-            for cell1d in self.cell1d:
-                cell1d = tuple(cell1d)
-                xcenters.append(cell1d[1])
-                ycenters.append(cell1d[2])
-                zcenters.append(cell1d[3])
-
-                vert_number = []
-                for i in cell1d[3:]:
-                    vert_number.append(int(i))
-
-                xcellvert = []
-                ycellvert = []
-                zcellvert = []
-                for ix in vert_number:
-                    xcellvert.append(vertexdict[ix][0])
-                    ycellvert.append(vertexdict[ix][1])
-                    zcellvert.append(vertexdict[ix][2])
-                xvertices.append(xcellvert)
-                yvertices.append(ycellvert)
-                zvertices.append(zcellvert)
-
+            cells = self.cell1d
+            ivert = 3
         else:
-            vertexdict = {v[0]: [v[1], v[2]] for v in self._vertices}
-            # build xy vertex and cell center info
-            for cell2d in self.cell2d:
-                cell2d = tuple(cell2d)
-                xcenters.append(cell2d[1])
-                ycenters.append(cell2d[2])
-
-                vert_number = []
-                for i in cell2d[4:]:
-                    vert_number.append(int(i))
-
-                xcellvert = []
-                ycellvert = []
-                for ix in vert_number:
-                    xcellvert.append(vertexdict[ix][0])
-                    ycellvert.append(vertexdict[ix][1])
-                xvertices.append(xcellvert)
-                yvertices.append(ycellvert)
+            cells = self.cell2d
+            ivert = 4
 
-            # build z cell centers
-            zvertices, zcenters = self._zcoords()
+        xcenters = np.array([cell[1] for cell in cells], dtype=float)
+        ycenters = np.array([cell[2] for cell in cells], dtype=float)
 
+        self._ensure_vert_arrays()
+        vert_coords = self._vert_coords
         if self._has_ref_coordinates:
-            # transform x and y
-            xcenters, ycenters = self.get_coords(xcenters, ycenters)
-            xvertxform = []
-            yvertxform = []
-            # vertices are a list within a list
-            for xcellvertices, ycellvertices in zip(xvertices, yvertices):
-                xcellvertices, ycellvertices = self.get_coords(
-                    xcellvertices, ycellvertices
-                )
-                xvertxform.append(xcellvertices)
-                yvertxform.append(ycellvertices)
-            xvertices = xvertxform
-            yvertices = yvertxform
+            # transform x and y of the vertices and cell centers in a single
+            # call, before the vertices are gathered for each cell
+            vert_coords = vert_coords.copy()
+            nvert = len(vert_coords)
+            x, y = self.get_coords(
+                np.concatenate((vert_coords[:, 0], xcenters)),
+                np.concatenate((vert_coords[:, 1], ycenters)),
+            )
+            vert_coords[:, 0] = x[:nvert]
+            vert_coords[:, 1] = y[:nvert]
+            xcenters = x[nvert:]
+            ycenters = y[nvert:]
+
+        # build flat vertex arrays, with the vertices of cell i stored in
+        # offsets[i]:offsets[i + 1]
+        iverts = [cell[ivert:] for cell in cells]
+        offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(iv) for iv in iverts])
+        flat_ids = np.fromiter(
+            (iv for cell_iverts in iverts for iv in cell_iverts),
+            dtype=np.int64,
+            count=offsets[-1],
+        )
+        flat_ids = self._vert_rows(flat_ids)
+        from ..utils._numba_kernels import gather_vertices
+
+        flat_coords = gather_vertices(vert_coords, flat_ids, offsets)
 
+        if self._cell1d is not None:
+            zcenters = [cell[3] for cell in cells]
+            vert_xy = np.ascontiguousarray(flat_coords[:, :2])
+            zvertices = flat_coords[:, 2]
+        else:
+            # build z cell centers
+            _, zcenters = self._zcoords()
+            vert_xy = flat_coords
+            zvertices = None
+
+        zcenters = np.array(zcenters)
+        # C-contiguous float64 x and y vertex arrays, used for the per cell
+        # vertex arrays and by the compiled kernels
+        xvert_flat = np.ascontiguousarray(vert_xy[:, 0], dtype=np.float64)
+        yvert_flat = np.ascontiguousarray(vert_xy[:, 1], dtype=np.float64)
+        bbox = np.column_stack(
+            [
+                np.minimum.reduceat(xvert_flat, offsets[:-1]),
+                np.maximum.reduceat(xvert_flat, offsets[:-1]),
+                np.minimum.reduceat(yvert_flat, offsets[:-1]),
+                np.maximum.reduceat(yvert_flat, offsets[:-1]),
+            ]
+        )
+
+        # the cached arrays are shared with the caller instead of copied,
+        # callers that need to modify them must make a copy
+        for arr in (
+            xcenters,
+            ycenters,
+            zcenters,
+            offsets,
+            vert_xy,
+            xvert_flat,
+            yvert_flat,
+            bbox,
+        ):
+            arr.setflags(write=False)
+        if zvertices is not None:
+            zvertices.setflags(write=False)
+
+        self._geom_rev += 1
         self._cache_dict[cache_index_cc] = CachedData(
-            [np.array(xcenters), np.array(ycenters), np.array(zcenters)]
+            [xcenters, ycenters, zcenters]
+        )
+        self._cache_dict[cache_index_csr] = CachedData(
+            [offsets, vert_xy, zvertices]
         )
-        self._cache_dict[cache_index_vert] = CachedData(
-            [xvertices, yvertices, zvertices]
+        self._cache_dict[cache_index_bbox] = CachedData(bbox)
+        self._cache_dict[cache_index_flat] = CachedData(
+            [xvert_flat, yvert_flat]
         )
 
+    def _ensure_vert_arrays(self):
+        """
+        Build the vertex number and local coordinate arrays of the grid
+        vertices. The arrays do not depend on the coordinate info, so they
+        are built once for the lifetime of the grid.
+
+        _vert_coords has shape (nvert, 2), or (nvert, 3) for cell1d grids,
+        and is stored in the order of the vertices. _vert_ids_sorted holds
+        the sorted vertex numbers, and _vert_order the rows in _vert_coords
+        of the sorted vertex numbers, or None when the vertex numbers are
+        0, 1, ..., nvert - 1.
+        """
+        if self._vert_coords is not None:
+            return
+        ndim = 3 if self._cell1d is not None else 2
+        nvert = len(self._vertices)
+        vert_ids = np.fromiter(
+            (v[0] for v in self._vertices), dtype=np.int64, count=nvert
+        )
+        vert_coords = np.array(
+            [[v[i] for i in range(1, ndim + 1)] for v in self._vertices],
+            dtype=float,
+        ).reshape(-1, ndim)
+        vert_coords.setflags(write=False)
+        if np.array_equal(vert_ids, np.arange(nvert)):
+            # vertex numbers are the rows of the coordinate array
+            order = None
+        else:
+            order = np.argsort(vert_ids, kind="stable")
+            vert_ids = vert_ids[order]
+        self._vert_ids_sorted = vert_ids
+        self._vert_order = order
+        self._vert_coords = vert_coords
+
+    def _vert_rows(self, vert_ids):
+        """
+        Get the rows in _vert_coords of an array of vertex numbers.
+        """
+        self._ensure_vert_arrays()
+        ids = self._vert_ids_sorted
+        if self._vert_order is None:
+            if len(vert_ids) and (
+                vert_ids.min() < 0 or vert_ids.max() >= len(ids)
+            ):
+                raise KeyError("cell vertex number not found in vertices")
+            return vert_ids
+        idx = np.searchsorted(ids, vert_ids)
+        idx[idx == len(ids)] = 0
+        if not np.array_equal(ids[idx], vert_ids):
+            raise KeyError("cell vertex number not found in vertices")
+        return self._vert_order[idx]
+
+    def _get_geometry_cache(self, cache_index):
+        """
+        Get data from the cache, building the grid geometry info first if
+        the cached data is missing or out of date. The data is not copied.
+        """
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            self._build_grid_geometry_info()
+        return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def _vert_offsets(self):
+        """
+        Array of size ncpl + 1, the vertices of cell i are stored in
+        _vert_xy[_vert_offsets[i]:_vert_offsets[i + 1]]
+        """
+        return self._get_geometry_cache("vertcsr")[0]
+
+    @property
+    def _vert_xy(self):
+        """
+        Array of shape (sum(nvertices per cell), 2) with the x and y
+        coordinates of the cell vertices, stored cell by cell
+        """
+        return self._get_geometry_cache("vertcsr")[1]
+
+    @property
+    def _xvert_flat(self):
+        """
+        C-contiguous float64 array with the x coordinates of the cell
+        vertices, stored cell by cell like _vert_xy
+        """
+        return self._get_geometry_cache("vertflat")[0]
+
+    @property
+    def _yvert_flat(self):
+        """
+        C-contiguous float64 array with the y coordinates of the cell
+        vertices, stored cell by cell like _vert_xy
+        """
+        return self._get_geometry_cache("vertflat")[1]
+
+    def _vertices_per_cell(self, vert_flat):
+        """
+        Reshape a flat vertex coordinate array to an array of shape
+        (ncpl, max number of vertices per cell). Cells with fewer vertices
+        are padded with nan.
+        """
+        offsets = self._vert_offsets
+        nverts = np.diff(offsets)
+        nmax = nverts.max() if len(nverts) > 0 else 0
+        if np.all(nverts == nmax):
+            return vert_flat.reshape(-1, nmax)
+        grid = np.full((len(nverts), nmax), np.nan)
+        icell = np.repeat(np.arange(len(nverts)), nverts)
+        grid[icell, np.arange(len(vert_flat)) - offsets[icell]] = vert_flat
+        return grid
+
     def get_xvertices_for_layer(self, layer):
-        xgrid = np.array(self.xvertices, dtype=object)
-        return xgrid
+        """
+        Get the x vertices of the cells as a float64 array of shape
+        (ncpl, max number of vertices per cell). Cells with fewer vertices
+        are padded with nan.
+        """
+        return self._vertices_per_cell(self._xvert_flat)
 
     def get_yvertices_for_layer(self, layer):
-        ygrid = np.array(self.yvertices, dtype=object)
-        return ygrid
+        """
+        Get the y vertices of the cells as a float64 array of shape
+        (ncpl, max number of vertices per cell). Cells with fewer vertices
+        are padded with nan.
+        """
+        return self._vertices_per_cell(self._yvert_flat)
 
     def get_xcellcenters_for_layer(self, layer):
         xcenters = np.array(self.xcellcenters)
@@ -554,41 +961,35 @@ class VertexGrid(Grid):
             number of plottable layers
 
         """
-        nplottable = 0
-        required_shape = self.get_plottable_layer_shape()
-        if a.shape == required_shape:
-            nplottable = 1
-        else:
-            nplottable = a.size / self.ncpl
-            nplottable = int(nplottable)
+        nplottable, remainder = divmod(a.size, self.ncpl)
+        if remainder:
+            raise ValueError(
+                f"Array of size {a.size} is not a multiple of ncpl "
+                f"({self.ncpl})"
+            )
         return nplottable
 
     def get_plottable_layer_array(self, a, layer):
         # ensure plotarray is 1d with length ncpl
-        required_shape = self.get_plottable_layer_shape()
         if a.ndim == 3:
-            if a.shape[0] == 1:
-                a = np.squeeze(a, axis=0)
-                plotarray = a[layer, :]
-            elif a.shape[1] == 1:
-                a = np.squeeze(a, axis=1)
-                plotarray = a[layer, :]
-            else:
+            if a.shape[0] != 1 and a.shape[1] != 1:
                 raise ValueError(
                     "Array has 3 dimensions so one of them must be of size 1 "
                     "for a VertexGrid."
                 )
+            plotarray = a.reshape(-1, a.shape[-1])[layer]
         elif a.ndim == 2:
-            plotarray = a[layer, :]
+            plotarray = a[layer]
         elif a.ndim == 1:
             plotarray = a
-            if plotarray.shape[0] == self.nnodes:
-                plotarray = plotarray.reshape(self.nlay, self.ncpl)
-                plotarray = plotarray[layer, :]
+            if a.shape[0] == self.nnodes:
+                plotarray = a.reshape(self.nlay, self.ncpl)[layer]
         else:
             raise ValueError("Array to plot must be of dimension 1 or 2")
-        msg = f"{plotarray.shape[0]} /= {required_shape}"
-        assert plotarray.shape == required_shape, msg
+        if plotarray.shape != (self.ncpl,):
+            raise ValueError(
+                f"{plotarray.shape[0]} /= {self.get_plottable_layer_shape()}"
+            )
         return plotarray
 
     # initialize grid from a grb file
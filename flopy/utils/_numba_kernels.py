@@ -0,0 +1,191 @@
+"""
+Compiled kernels for grid geometry operations. The kernels are compiled
+with numba when it is installed; otherwise equivalent NumPy implementations
+are used. numba is imported, and a kernel compiled, the first time the
+kernel is needed, so code paths that do not need a kernel never load numba.
+
+"""
+
+import numpy as np
+
+from .utl_import import import_optional_dependency
+
+# replaced by numba.prange before the kernels are compiled
+prange = range
+
+# compiled kernels by name, None when numba is not installed
+_compiled = {}
+
+# minimum number of gathered vertices for which the compiled gather kernel
+# is used, smaller grids do not make up for the compile time
+GATHER_MIN_SIZE = 100_000
+
+
+def _point_in_poly(px, py, xs, ys, tol=1e-9):
+    """
+    Crossing number (ray cast) test of a single point against a polygon.
+    The polygon can be defined clockwise or counter-clockwise and can be
+    open or closed.
+
+    Parameters
+    ----------
+    px : float
+        x-coordinate of the point
+    py : float
+        y-coordinate of the point
+    xs : np.ndarray
+        C-contiguous float64 array of polygon x-coordinates
+    ys : np.ndarray
+        C-contiguous float64 array of polygon y-coordinates
+    tol : float
+        points within this distance of the polygon boundary are
+        considered inside (default is 1e-9)
+
+    Returns
+    -------
+    inside : bool
+
+    """
+    n = xs.shape[0]
+    inside = False
+    j = n - 1
+    for i in range(n):
+        dx = xs[j] - xs[i]
+        dy = ys[j] - ys[i]
+        # points within tol of the edge are considered inside
+        seglen2 = dx * dx + dy * dy
+        t = 0.0
+        if seglen2 > 0.0:
+            t = ((px - xs[i]) * dx + (py - ys[i]) * dy) / seglen2
+            t = min(max(t, 0.0), 1.0)
+        ex = xs[i] + t * dx - px
+        ey = ys[i] + t * dy - py
+        if ex * ex + ey * ey <= tol * tol:
+            return True
+        if (ys[i] > py) != (ys[j] > py):
+            if px < dx * (py - ys[i]) / dy + xs[i]:
+                inside = not inside
+        j = i
+    return inside
+
+
+def _point_in_poly_numpy(px, py, xs, ys, tol=1e-9):
+    """
+    NumPy implementation of point_in_poly, used when numba is not
+    installed.
+
+    """
+    xj = np.roll(xs, 1)
+    yj = np.roll(ys, 1)
+    dx = xj - xs
+    dy = yj - ys
+    seglen2 = dx * dx + dy * dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(
+            seglen2 > 0.0, ((px - xs) * dx + (py - ys) * dy) / seglen2, 0.0
+        )
+        t = np.clip(t, 0.0, 1.0)
+        d2 = (xs + t * dx - px) ** 2 + (ys + t * dy - py) ** 2
+        if np.any(d2 <= tol * tol):
+            return True
+        straddle = (ys > py) != (yj > py)
+        xcross = dx * (py - ys) / dy + xs
+    return bool(np.count_nonzero(straddle & (px < xcross)) % 2)
+
+
+def point_in_poly(px, py, xs, ys, tol=1e-9):
+    """
+    Crossing number test of a single point against a polygon, see
+    _point_in_poly. The compiled kernel is used when numba is installed.
+
+    """
+    kernel = _get_compiled("point_in_poly")
+    if kernel is None:
+        return _point_in_poly_numpy(px, py, xs, ys, tol)
+    return kernel(px, py, xs, ys, tol)
+
+
+def _gather_vertices(flat_ids, coords, offsets, out):
+    """
+    Gather vertex coordinates for each cell into a flat array, with the
+    cells processed in parallel.
+
+    Parameters
+    ----------
+    flat_ids : np.ndarray
+        int64 array of vertex rows in coords, stored cell by cell
+    coords : np.ndarray
+        C-contiguous float64 array of vertex coordinates, shape
+        (nvert, ndim)
+    offsets : np.ndarray
+        int64 array of size ncells + 1, the vertices of cell i are stored
+        in flat_ids[offsets[i]:offsets[i + 1]]
+    out : np.ndarray
+        float64 array of shape (len(flat_ids), ndim) that is filled with
+        the gathered coordinates
+
+    """
+    ndim = coords.shape[1]
+    for c in prange(offsets.shape[0] - 1):
+        for k in range(offsets[c], offsets[c + 1]):
+            for j in range(ndim):
+                out[k, j] = coords[flat_ids[k], j]
+
+
+def gather_vertices(coords, flat_ids, offsets):
+    """
+    Gather vertex coordinates for each cell, equivalent to
+    np.take(coords, flat_ids, axis=0). The compiled kernel is used for
+    large grids when numba is installed.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        float array of vertex coordinates, shape (nvert, ndim)
+    flat_ids : np.ndarray
+        int64 array of vertex rows in coords, stored cell by cell
+    offsets : np.ndarray
+        int64 array of size ncells + 1 with the start of each cell in
+        flat_ids
+
+    Returns
+    -------
+    np.ndarray
+        float64 array of shape (len(flat_ids), ndim)
+
+    """
+    kernel = None
+    if len(flat_ids) >= GATHER_MIN_SIZE:
+        kernel = _get_compiled("gather_vertices")
+    if kernel is None:
+        return np.take(coords, flat_ids, axis=0)
+    coords = np.ascontiguousarray(coords, dtype=np.float64)
+    out = np.empty((len(flat_ids), coords.shape[1]), dtype=np.float64)
+    kernel(flat_ids, coords, offsets, out)
+    return out
+
+
+# python kernels and their numba.njit options
+_kernels = {
+    "point_in_poly": (_point_in_poly, {"cache": True}),
+    "gather_vertices": (_gather_vertices, {"parallel": True, "cache": True}),
+}
+
+
+def _get_compiled(name):
+    """
+    Get the numba dispatcher of a kernel, importing numba and creating the
+    dispatcher on first use. Returns None when numba is not installed.
+
+    """
+    global prange
+
+    if name not in _compiled:
+        numba = import_optional_dependency("numba", errors="silent")
+        if numba is None:
+            _compiled[name] = None
+        else:
+            prange = numba.prange
+            func, options = _kernels[name]
+            _compiled[name] = numba.njit(**options)(func)
+    return _compiled[name]